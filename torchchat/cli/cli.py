@@ -147,6 +147,13 @@ def _add_model_config_args(parser, verb: str) -> None:
             action="store_true",
             help="Whether to compile the prefill. Improves prefill perf, but has higher compile times.",
         )
+        model_config_parser.add_argument(
+            "--compile-level",
+            type=int,
+            default=0,
+            choices=[0, 1, 2, 3, 4],
+            help="Compilation level for the loaded model: 0/1 eager, 2 dynamo with the eager backend, 3 inductor (reduce-overhead), 4 inductor with max-autotune",
+        )
 
     model_config_parser.add_argument(
         "--dtype",
@@ -170,6 +177,11 @@ def _add_model_config_args(parser, verb: str) -> None:
         choices=["fast", "cpu", "cuda", "mps"],
         help="Hardware device to use. Options: cpu, cuda, mps",
     )
+    model_config_parser.add_argument(
+        "--convert-to-safetensors",
+        action="store_true",
+        help="Convert a .pth checkpoint to safetensors on first load so later loads mmap it without unpickling",
+    )
 
 
 # Add CLI Args representing output paths of exported model files
@@ -3,6 +3,7 @@
 
 # This source code is licensed under the license found in the
 # LICENSE file in the root directory of this source tree.
+import functools
 import json
 from dataclasses import dataclass, field
 from enum import Enum
@@ -77,6 +78,9 @@ def load_model_configs() -> Dict[str, ModelConfig]:
     return model_configs
 
 
+# Memoized: builder and tokenizer args both resolve the same model name,
+# and speculative decoding resolves it again for the draft model.
+@functools.lru_cache(maxsize=None)
 def resolve_model_config(model: str) -> ModelConfig:
     model = model.lower()
     # Lazy load model config from JSON.
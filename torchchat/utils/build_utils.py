@@ -6,6 +6,7 @@
 
 from __future__ import annotations
 
+import functools
 import logging
 import os
 
@@ -148,6 +149,9 @@ def get_precision():
 ###               dtype name to torch.dtype mapping                    ###
 
 
+# Pure in (name, device); memoized since it runs once per model build and
+# speculative decoding builds both a target and a draft model.
+@functools.lru_cache(maxsize=None)
 def name_to_dtype(name, device):
     if (name == "fast") or (name == "fast16"):
         # MacOS now supports bfloat16
@@ -161,10 +165,25 @@ def name_to_dtype(name, device):
         return torch.bfloat16
 
     try:
-        return name_to_dtype_dict[name]
+        dtype = name_to_dtype_dict[name]
     except KeyError:
         raise RuntimeError(f"unsupported dtype name {name} specified")
 
+    if dtype == torch.bfloat16 and "cuda" in get_device_str(device):
+        if not torch.cuda.is_bf16_supported():
+            # Fall back loudly rather than failing deep inside the load path;
+            # float16 trades bfloat16's range for precision.
+            logging.warning(
+                "bfloat16 is not supported on this CUDA device; using float16"
+            )
+            return torch.float16
+    elif dtype == torch.float8_e4m3fn:
+        if "cuda" not in get_device_str(device) or torch.cuda.get_device_capability() < (8, 9):
+            raise RuntimeError(
+                f"dtype {name} requires a CUDA device with compute capability 8.9 or later"
+            )
+    return dtype
+
 
 def allowable_dtype_names() -> List[str]:
     return name_to_dtype_dict.keys()
@@ -179,6 +198,8 @@ name_to_dtype_dict = {
     "float32": torch.float,
     "float16": torch.float16,
     "bfloat16": torch.bfloat16,
+    "fp8": torch.float8_e4m3fn,
+    "float8": torch.float8_e4m3fn,
     "fast": None,
     "fast16": None,
 }
@@ -208,7 +229,9 @@ def find_multiple(n: int, k: int) -> int:
 
 def device_sync(device="cpu"):
     if "cuda" in device:
-        torch.cuda.synchronize(device)
+        # Sync only the current stream; a device-wide synchronize would also
+        # stall unrelated streams (e.g. checkpoint staging or prefetch work).
+        torch.cuda.current_stream(torch.device(device)).synchronize()
     elif ("cpu" in device) or ("mps" in device):
         pass
     else: